@@ -1,17 +1,28 @@
 import json
 import logging
+import os
 import sys  # импорт библиотеки sys для логирования в sys.stdout, так как по умолчанию происходит в sys.stderr
 from json import JSONDecodeError
+from random import sample
 
-import numpy as np
+try:
+    import orjson  # быстрый сериализатор json, при его отсутствии используется стандартный модуль json
+
+    dumps = orjson.dumps  # сохранение читается только программой, поэтому json пишется без отступов
+except ImportError:
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode()
 
 logging.basicConfig(level=logging.INFO,
                     handlers=[logging.StreamHandler(sys.stdout)],
                     format='%(message)s')
+logger = logging.getLogger(__name__)  # логгер модуля, отключается при запуске игры без вывода
 
 
 class Field:
     """Стандартное поле"""
+    __slots__ = ('board', 'position', 'row', 'col', 'is_white', 'is_fire', 'is_available', 'players', 'has_key',
+                 'neighbors')
 
     def __init__(self, board, position: tuple, is_white=True, is_available=True):
         """
@@ -22,92 +33,94 @@ class Field:
         """
         self.board = board
         self.position = position
+        self.row, self.col = position
         self.is_white = is_white
         self.is_fire = False
         self.is_available = is_available
 
-        self.players = []
-        self._has_key = False
-
-        self.board[position] = self
+        self.players = set()
+        self.has_key = False  # лежит ли на поле ключ
+        self.neighbors = {}  # соседние поля по направлениям движения, заполняется доской после ее создания
 
     def __str__(self):
-        status = f'Вы заходите на поле {self.position}.'
+        parts = [f'Вы заходите на поле {self.position}.']
         if self.players:
-            status += ' Здесь уже есть следующие герои - ' + ", ".join([str(player) for player in self.players]) + '.'
+            parts.append(' Здесь уже есть следующие герои - ' + ', '.join(map(str, self.players)) + '.')
         if self.has_key:
-            status += ' Вы видите ключ.'
-        return status
+            parts.append(' Вы видите ключ.')
+        return ''.join(parts)
 
-    @property
-    def has_key(self):
-        """Лежит ли на поле ключ"""
-        return self._has_key
+    def place_key(self):
+        """Положить ключ на поле, при этом запоминается локация ключа на доске для сохранения в файл"""
+        self.has_key = True
+        self.board.key_location = self.position
 
-    @has_key.setter
-    def has_key(self, value):
-        """При добавлении или удалении ключа к полю будет изменяться локация ключа на поле для сохранения в файл"""
-        self.board.key_location = self.position if value else None
-        self._has_key = value
+    def remove_key(self):
+        """Убрать ключ с поля, локация ключа на доске обнуляется"""
+        self.has_key = False
+        self.board.key_location = None
 
     def effect_on_player(self, player):
         """Эффект поля на игрока в зависимости от того горит ли поле, в дальнейшем будет суммироваться с эффектами
         других полей"""
         if self.is_fire:
             player.hurt()
-            logging.info(f'{player} получает урон от огня!')
+            logger.info('%s получает урон от огня!', player)
 
     def player_enters(self, player):
-        """Выполняется при входе игрока на поле. Если текущая позиция игрока уже не пустая, то это движение игрока,
-        а не инициализация его на карте. При этом кроме добавления игрока в список игроков этого поля происходит
-        очищение поля, с которого игрок уходит и воздействие эффектов поля на игрока"""
-        if player.current_field:
-            logging.info(self)
-            player.current_field.player_leaves(player)
-            self.effect_on_player(player)
+        """Выполняется при движении игрока на поле. Кроме добавления игрока в список игроков этого поля происходит
+        очищение поля, с которого игрок уходит и воздействие эффектов поля на игрока. Начальное размещение игрока на
+        карте происходит напрямую в Player.__init__"""
+        logger.info(self)
+        player.current_field.player_leaves(player)
+        self.effect_on_player(player)
 
-        self.players.append(player)
+        self.players.add(player)
 
     def player_leaves(self, player):
-        self.players.remove(player)
+        self.players.discard(player)
 
 
 class Wall(Field):
     """Поле со стеной, которое отталкивает назад и наносит урон, также присутствует оранжевый цвет для фильтрации"""
+    __slots__ = ()
 
     def __init__(self, board, position):
         super().__init__(board, position, is_white=False, is_available=False)
 
     def player_enters(self, player):
         player.hurt()
-        logging.info(f'{player} ударился о стену!')
+        logger.info('%s ударился о стену!', player)
 
 
 class Altar(Field):
     """Поле с алтарём, который полностью восстанавливает здоровье"""
+    __slots__ = ()
 
     def effect_on_player(self, player):
         super().effect_on_player(player)
         player.full_recovery()
-        logging.info(f'О чудо! {player} находит Алтарь и он полностью исцелён!')
+        logger.info('О чудо! %s находит Алтарь и он полностью исцелён!', player)
 
 
 class Golem(Field):
     """Поле с големом, является финишным полем. При наличии ключа игрок побеждает, иначе погибает"""
+    __slots__ = ()
 
     def effect_on_player(self, player):
         super().effect_on_player(player)
         if player.has_key:
-            logging.info(f'{player} нашел Голема и открывает его ключом!')
+            logger.info('%s нашел Голема и открывает его ключом!', player)
             player.is_win = True
         else:
-            logging.info(f'{player} нашел Голема, но у него нет ключа!')
+            logger.info('%s нашел Голема, но у него нет ключа!', player)
             player.die()
 
 
 class EmptySpace(Field):
     """Пустое поле для придания карте прямоугольной формы, также в контексте данного проекта ему придается
     оранжевый цвет для фильтрации белых полей, на которых может загореться огонь"""
+    __slots__ = ()
 
     def __init__(self, board, position):
         super().__init__(board, position, is_white=False)
@@ -115,12 +128,13 @@ class EmptySpace(Field):
 
 class Board:
     SYMBOLS = {'a': Altar, 'f': Field, 'w': Wall, 'g': Golem, 'e': EmptySpace}
+    MOVE_DIRECTIONS = {'вверх': (-1, 0), 'вниз': (1, 0), 'влево': (0, -1), 'вправо': (0, 1)}
 
-    def __init__(self, original_board, orange_fields, key_field, burning_fields=None):
+    def __init__(self, class_board, orange_fields, key_field, burning_fields=None):
         """
-        При создании карты происходит ее рендирования из заданного текстового формата в двухмерный массив объектов
-        полей в зависимости от буквы на оригинальной доске.
-        :param original_board: Двухмерный массив оригинальной доски в текстовом формате.
+        При создании карты происходит ее рендирования в двухмерный массив объектов полей по заранее подготовленному
+        двухмерному массиву классов полей (см. Game.CLASS_BOARD).
+        :param class_board: Двухмерный массив классов полей оригинальной доски.
         :param orange_fields: Список полей оранжевого цвета.
         :param key_field: Позиция расположение ключа на поле. При загрузке игры может быть None, так как ключ может
         принадлежать игроку.
@@ -129,47 +143,58 @@ class Board:
         self.key_location = None
         self.burning_fields = []
 
-        self.create_board(original_board, orange_fields, key_field, burning_fields)
+        self.create_board(class_board, orange_fields, key_field, burning_fields)
 
-    def create_board(self, original_board, orange_fields, key_field, burning_fields):
-        """Конвертация текстовой карты в карту с объектами полей, огнями и ключом"""
-        width, height = len(original_board[0]), len(original_board)
-        self.fields = np.empty(shape=(height, width), dtype=object)
+    def create_board(self, class_board, orange_fields, key_field, burning_fields):
+        """Конвертация карты классов в карту с объектами полей, огнями и ключом"""
+        self.fields = [[field_class(self, (i, j)) for j, field_class in enumerate(row)]
+                       for i, row in enumerate(class_board)]
+        self.link_neighbors()
 
-        for i in range(height):
-            for j in range(width):
-                self.SYMBOLS[original_board[i][j]](self, position=(i, j))
-
-        for pos in orange_fields:
-            self.fields[pos].is_white = False
+        for i, j in orange_fields:
+            self.fields[i][j].is_white = False
+        # разделение на белые и оранжевые поля не меняется в течение игры, поэтому белые поля запоминаются один раз
+        self.white_fields = [field for row in self.fields for field in row if field.is_white]
 
         if key_field:
-            self.fields[key_field].has_key = True
+            i, j = key_field
+            self.fields[i][j].place_key()
 
         if burning_fields:
-            for pos in burning_fields:
-                field = self.fields[pos]
+            for i, j in burning_fields:
+                field = self.fields[i][j]
                 field.is_fire = True
                 self.burning_fields.append(field)
-            logging.info(
-                'Горят следующие поля: ' + ', '.join(str(field.position) for field in self.burning_fields) + '.')
+            if logger.isEnabledFor(logging.INFO):
+                positions = ', '.join(str(field.position) for field in self.burning_fields)
+                logger.info('Горят следующие поля: %s.', positions)
+
+    def link_neighbors(self):
+        """Однократное запоминание соседей каждого поля по направлениям движения. За пределами доски сосед - None"""
+        height, width = len(self.fields), len(self.fields[0])
+        for row in self.fields:
+            for field in row:
+                for direction, (dx, dy) in self.MOVE_DIRECTIONS.items():
+                    i, j = field.row + dx, field.col + dy
+                    field.neighbors[direction] = self.fields[i][j] if 0 <= i < height and 0 <= j < width else None
 
     def burn(self):
         """В конце раунда случайно только из белых полей загораются 4 поля"""
-        white_fields = [field for field in self.fields.flatten() if field.is_white]
-        self.burning_fields = np.random.choice(white_fields, size=4, replace=False)
-        for field in white_fields:
-            field.is_fire = field in self.burning_fields
-        logging.info(
-            'Загорелись следующие поля: ' + ', '.join(str(field.position) for field in self.burning_fields) + '.')
+        for field in self.burning_fields:
+            field.is_fire = False
 
-    def __getitem__(self, index: tuple):
-        return self.fields[index]
+        self.burning_fields = sample(self.white_fields, 4)
+        for field in self.burning_fields:
+            field.is_fire = True
+        if logger.isEnabledFor(logging.INFO):
+            positions = ', '.join(str(field.position) for field in self.burning_fields)
+            logger.info('Загорелись следующие поля: %s.', positions)
 
-    def __setitem__(self, key, value):
-        self.fields[key] = value
+    def __getitem__(self, index: tuple):
+        """Доступ к полю по кортежу координат, внутри модуля поля берутся напрямую из self.fields"""
+        i, j = index
+        return self.fields[i][j]
 
-    @property
     def to_json(self) -> dict:
         """Создание словаря для записи статуса доски в json"""
         return dict(burning_fields=[field.position for field in self.burning_fields],
@@ -177,6 +202,8 @@ class Board:
 
 
 class Player:
+    __slots__ = ('name', 'health', 'previous_fields', 'current_field', 'number_of_actions', 'number_of_medicine',
+                 'has_key', 'is_win', 'is_escaped')
     MAX_HEALTH = 5
     NUMBER_OF_MEDICINE = 3
 
@@ -196,8 +223,8 @@ class Player:
         self.name = name
         self.health = health
         self.previous_fields = previous_fields if previous_fields else []
-        self._current_field = None
-        self.current_field = current_field
+        self.current_field = current_field  # размещение на карте не является ходом, поэтому без проверок enter_field
+        current_field.players.add(self)
         self.number_of_actions = number_of_actions
         self.number_of_medicine = number_of_medicine
         self.has_key = has_key
@@ -207,31 +234,26 @@ class Player:
     def __str__(self):
         return f'Герой {self.name}'
 
-    @property
-    def current_field(self):
-        return self._current_field
-
-    @current_field.setter
-    def current_field(self, field):
+    def enter_field(self, field):
         """При изменении текущей локации игрока проверяется не является ли ход игрока бегством, а также является ли
         поле доступным для перехода (field.is_available), а также менять значение предыдущего поля, если это именно
         движение игрока и новое поле белого цвета"""
         if field in self.previous_fields:
             self.die()
             self.is_escaped = True
-            logging.info(f'{self} струсил и убежал!')
+            logger.info('%s струсил и убежал!', self)
             return
 
         field.player_enters(self)
 
         if field.is_available:
-            if self.current_field and field.is_white:
+            if field.is_white:
                 if self.current_field.is_white:
                     self.previous_fields = [self.current_field]
                 else:
                     self.previous_fields.append(self.current_field)
 
-            self._current_field = field
+            self.current_field = field
 
     def spend_action(self, value=1):
         """Трата действий игрока при совершении хода"""
@@ -239,24 +261,24 @@ class Player:
 
     def move(self, field):
         """Движение игрока"""
-        self.current_field = field
+        self.enter_field(field)
         self.spend_action()
 
     def strike(self, other):
         """Удар игрока"""
-        logging.info(f'{self} ударил {other}')
+        logger.info('%s ударил %s', self, other)
         other.hurt()
 
     def strike_all_in_the_field(self):
         """Удар игрока по всем игрокам, если они присутствуют на поле, иначе действие не тратится"""
         if len(self.current_field.players) > 1:  # если в текущем поле, есть другие игроки кроме себя
             for player in self.current_field.players:
-                if player != self:
+                if player is not self:
                     self.strike(player)
 
             self.spend_action()
         else:
-            logging.warning('А ударить-то некого!')
+            logger.warning('А ударить-то некого!')
 
     def hurt(self, damage=1):
         """Ранение игрока"""
@@ -266,30 +288,31 @@ class Player:
         """Взять ключ, если он области досягаемости"""
         if self.current_field.has_key:
             self.has_key = True
-            self.current_field.has_key = False
+            self.current_field.remove_key()
 
             self.spend_action()
-            logging.info(f'{self} находит ключ!')
+            logger.info('%s находит ключ!', self)
         else:
-            logging.info('А брать-то нечего!')
+            logger.info('А брать-то нечего!')
 
     def drop_key(self):
         """Сброс ключа в текущее поле"""
         if self.has_key:
             self.has_key = False
-            self.current_field.has_key = True
-            logging.info(f'{self} теряет ключ на поле {self.current_field.position}')
+            self.current_field.place_key()
+            logger.info('%s теряет ключ на поле %s', self, self.current_field.position)
 
     def heal(self):
         """Лечение игрока"""
         if self.number_of_medicine > 0:
             self.number_of_medicine -= 1
-            self.health = min(self.health + 1, self.MAX_HEALTH)
+            health = self.health + 1
+            self.health = health if health < self.MAX_HEALTH else self.MAX_HEALTH
 
             self.spend_action()
-            logging.info(f'{self} полечился.')
+            logger.info('%s полечился.', self)
         else:
-            logging.info('У вас нет аптечек!')
+            logger.info('У вас нет аптечек!')
 
     def full_recovery(self):
         """Полное восстановление здоровья"""
@@ -303,7 +326,6 @@ class Player:
     def is_alive(self):
         return self.health > 0
 
-    @property
     def to_json(self) -> dict:
         """Создание словаря для записи статуса игрока в json"""
         return dict(name=self.name,
@@ -323,13 +345,25 @@ class Game:
                       ['e', 'w', 'f', 'f', 'f', 'w', 'f', 'a', 'w', 'e'],
                       ['w', 'f', 'f', 'w', 'f', 'f', 'f', 'w', 'e', 'e'],
                       ['e', 'w', 'w', 'e', 'w', 'w', 'w', 'e', 'e', 'e']]
+    # Классы полей оригинальной доски, вычисляются один раз при загрузке модуля
+    CLASS_BOARD = [[Board.SYMBOLS[symbol] for symbol in row] for row in ORIGINAL_BOARD]
 
     ORANGE_FIELDS = ((2, 3), (1, 5), (3, 7))
     START_FIELD = (4, 1)
     KEY_FIELD = (2, 3)
 
-    def __init__(self):
-        self.board = Board(self.ORIGINAL_BOARD, self.ORANGE_FIELDS, self.KEY_FIELD)
+    def __init__(self, run_silent=False):
+        """
+        :param run_silent: Запуск без вывода сообщений, например, для автоматических прогонов игры. Отключает
+        вывод через self.log, а также логгер модуля. Логгер общий для всего модуля, поэтому после такого запуска
+        сообщения полей и игроков не выводятся и в других играх, пока логгер не будет включен обратно
+        (logger.disabled = False). Остальное логирование процесса не затрагивается.
+        """
+        self.log = print
+        if run_silent:
+            self.log = lambda *args, **kwargs: None
+            logger.disabled = True
+        self.board = Board(self.CLASS_BOARD, self.ORANGE_FIELDS, self.KEY_FIELD)
         self.players = []
 
     def start(self):
@@ -337,28 +371,28 @@ class Game:
         self.creating_game()
         self.loop()
 
-    @staticmethod
-    def greet():
-        print('-' * 100)
-        print('{:^100s}'.format('Добро пожаловать'))
-        print('{:^100s}'.format('в игру'))
-        print('{:^100s}'.format('"ТАЙНЫ ПОДЗЕМЕЛЬЯ"'))
-        print('-' * 100)
-        print('{:^100s}'.format('Правила игры'))
-        print('Первым добраться до голема и с помощью ключа покинуть локацию.')
-        print('Возврат на предыдущую клетку, если Вы вернулись не с оранжевой клетки означает бегство.')
-        print('На оранжевую клетку можно зайти лишь 1 раз, иначе такой ход тоже будет считаться бегством.')
-        print('Ход пропускать нельзя, у вас имеется 3 аптечки. При столкновении со стеной получаете урон.')
-        print('При нанесении удара по противникам, получают урон все Герои, находящиеся в этой клетке.')
-        print('Доступны следующие команды: "вверх", "вниз", "влево", "вправо", "ударить", "лечить", "взять".')
-        print('Также Вы в любой момент можете сохранить весь прогресс и выйти из игры с помощью команды: "сохранить".')
-        print('-' * 100)
+    def greet(self):
+        self.log('-' * 100)
+        self.log('{:^100s}'.format('Добро пожаловать'))
+        self.log('{:^100s}'.format('в игру'))
+        self.log('{:^100s}'.format('"ТАЙНЫ ПОДЗЕМЕЛЬЯ"'))
+        self.log('-' * 100)
+        self.log('{:^100s}'.format('Правила игры'))
+        self.log('Первым добраться до голема и с помощью ключа покинуть локацию.')
+        self.log('Возврат на предыдущую клетку, если Вы вернулись не с оранжевой клетки означает бегство.')
+        self.log('На оранжевую клетку можно зайти лишь 1 раз, иначе такой ход тоже будет считаться бегством.')
+        self.log('Ход пропускать нельзя, у вас имеется 3 аптечки. При столкновении со стеной получаете урон.')
+        self.log('При нанесении удара по противникам, получают урон все Герои, находящиеся в этой клетке.')
+        self.log('Доступны следующие команды: "вверх", "вниз", "влево", "вправо", "ударить", "лечить", "взять".')
+        self.log('Также Вы в любой момент можете сохранить весь прогресс и выйти из игры с помощью команды: '
+                 '"сохранить".')
+        self.log('-' * 100)
 
     def creating_game(self):
         """При наличии файла сохраненной игры и успешной попытки декодирования данных, игроку предлагается загрузить
-        игру. При отказе создается новая игра. Также по умолчанию файл сохраненной игры всегда обнуляется."""
+        игру. При отказе создается новая игра. Также по умолчанию файл сохраненной игры всегда удаляется."""
         try:
-            with open('save.json') as f:
+            with open('save.json', 'rb') as f:  # json.load сам определяет кодировку, сохранение пишется в utf-8
                 save = json.load(f)
 
             if input('Если Вы хотите ЗАГРУЗИТЬ игру, введите "да", иначе будет запущена НОВАЯ игра: ').lower() == 'да':
@@ -369,24 +403,28 @@ class Game:
         except (FileNotFoundError, JSONDecodeError):
             self.new_game()
         finally:
-            open('save.json', 'w').close()
+            try:
+                os.remove('save.json')
+            except OSError:
+                pass
 
     def new_game(self):
         """Новая игра"""
-        self.board = Board(self.ORIGINAL_BOARD, self.ORANGE_FIELDS, self.KEY_FIELD)
+        self.board = Board(self.CLASS_BOARD, self.ORANGE_FIELDS, self.KEY_FIELD)
         self.creating_players()
 
     def load_game(self, save):
         """Загрузка игра"""
-        print('Загрузка карты...')
-        key_field = tuple(save['board']['key_location']) if save['board']['key_location'] else None
-        burning_fields = [tuple(pos) for pos in save['board']['burning_fields']]
-        self.board = Board(self.ORIGINAL_BOARD, self.ORANGE_FIELDS, key_field, burning_fields)
-        print('Загрузка игроков...')
+        self.log('Загрузка карты...')
+        self.board = Board(self.CLASS_BOARD, self.ORANGE_FIELDS,
+                           save['board']['key_location'], save['board']['burning_fields'])
+        fields = self.board.fields
+        self.log('Загрузка игроков...')
         for player in save['players']:
-            current_field = self.board[tuple(player['current_field'])]
+            i, j = player['current_field']
+            current_field = fields[i][j]
             if player['previous_fields']:
-                previous_fields = [self.board[tuple(pos)] for pos in player['previous_fields']]
+                previous_fields = [fields[i][j] for i, j in player['previous_fields']]
             else:
                 previous_fields = None
 
@@ -401,6 +439,8 @@ class Game:
 
     def creating_players(self):
         """Создание игроков, размещение их на стартовой позиции поля и добавление в общий список игроков"""
+        i, j = self.START_FIELD
+        start_field = self.board.fields[i][j]
         while True:
             answer = input('Введите количество игроков: ')
             if not answer.isdigit():
@@ -408,7 +448,7 @@ class Game:
 
             for i in range(int(answer)):
                 name = input(f'Введите имя {i + 1}-го героя: ').title()
-                player = Player(name, current_field=self.board[self.START_FIELD])
+                player = Player(name, current_field=start_field)
                 self.players.append(player)
 
             return
@@ -417,32 +457,34 @@ class Game:
         """Ход игрока. В начале и в конце хода проверяется количество здоровья игрока. Пока игрок не совершит
         результативное действие у него будет возможность ходить. Также при возможности взять ключ, ему будет выведена в
         сообщение"""
+        actions = {'ударить': player.strike_all_in_the_field,
+                   'взять': player.take_key,
+                   'лечить': player.heal,
+                   'сохранить': self.save}
+
         while player.number_of_actions and player.is_alive:
+            current_field = player.current_field
 
-            if player.current_field.has_key:
-                logging.info(f'{player} может взять ключ!')
+            if current_field.has_key:
+                logger.info('%s может взять ключ!', player)
 
-            move_directions = {'вверх': (-1, 0), 'вниз': (1, 0), 'влево': (0, -1), 'вправо': (0, 1)}
-            actions = {'ударить': player.strike_all_in_the_field,
-                       'взять': player.take_key,
-                       'лечить': player.heal,
-                       'сохранить': self.save}
             action = input(
                 f'{player}, у Вас жизней - {player.health} и аптечек - {player.number_of_medicine}. Ваши действия: '
             ).lower()
-            if action in move_directions:
-                dx, dy = move_directions[action]
-                pos_x, pos_y = player.current_field.position
-                new_field = self.board[pos_x + dx, pos_y + dy]
+            if action in Board.MOVE_DIRECTIONS:
+                new_field = current_field.neighbors[action]
+                if new_field is None:
+                    self.log('Дальше идти некуда!')
+                    continue
                 player.move(new_field)
             elif action in actions:
                 actions[action]()
             else:
-                print('Не понял Ваши намерения...')
+                self.log('Не понял Ваши намерения...')
 
         if not player.is_alive:
             if not player.is_escaped:
-                logging.info(f'{player} погибает!')
+                logger.info('%s погибает!', player)
             self.destroy(player)
 
     def destroy(self, player):
@@ -450,7 +492,7 @@ class Game:
         player.drop_key()
         player.current_field.player_leaves(player)
         self.players.remove(player)
-        logging.info(f'{player} выводится из игры...')
+        logger.info('%s выводится из игры...', player)
 
     def end_of_round(self):
         """Функция вызывается в конце раунда для восстановления возможности ходить игрокам и зажжению огня на 4-х
@@ -462,28 +504,28 @@ class Game:
 
     def save(self):
         """Сохранение игры в json-файл"""
-        print('Сохранение...')
-        with open('save.json', 'w') as f:
-            json_obj = dict(players=[player.to_json for player in self.players],
-                            board=self.board.to_json)
-            json.dump(json_obj, f, indent=4)
-        print('Выходим из игры...')
+        self.log('Сохранение...')
+        with open('save.json', 'wb') as f:
+            json_obj = dict(players=[player.to_json() for player in self.players],
+                            board=self.board.to_json())
+            f.write(dumps(json_obj))
+        self.log('Выходим из игры...')
         exit()
 
     def loop(self):
         """Основной цикл программы. Итерация идет по копии списка игроков, чтобы при удалении игроков из списка итератор
          не сбивался"""
         while self.players:
-            print('-' * 100)
+            self.log('-' * 100)
             for player in self.players[:]:
                 self.turn(player)
-                print()
+                self.log()
                 if player.is_win:
-                    logging.info(f'Поздравляем! {player} преодолел все препятствия и победил!')
+                    logger.info('Поздравляем! %s преодолел все препятствия и победил!', player)
                     return
 
             self.end_of_round()
-        print('\nКонец игры. Игроков больше нет!')
+        self.log('\nКонец игры. Игроков больше нет!')
 
 
 if __name__ == '__main__':